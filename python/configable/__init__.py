@@ -1,11 +1,36 @@
-import inspect
+import sys
+from functools import lru_cache
 
 
 class ConfigableBase(object):
-    pass
+    # No instance state of its own; without this every subclass instance
+    # would get a __dict__ from here whether it wants one or not.
+    __slots__ = ()
 
 
-class Configable(ConfigableBase):
+class ConfigableMeta(type):
+    """
+    Gives a Configable class that declares EXTRA_ATTRS = False a
+    __slots__ made of its settings' private storage names, so instances
+    carry a fixed-size array instead of a per-instance dict. The
+    default (EXTRA_ATTRS = True, inherited) keeps the dict, since
+    setting callbacks commonly hang extra attributes off the instance.
+    """
+    def __new__(meta, name, bases, namespace):
+        extra = namespace.get('EXTRA_ATTRS')
+        if extra is None:
+            extra = getattr(bases[0], 'EXTRA_ATTRS', True) if bases else True
+        if not extra and '__slots__' not in namespace:
+            namespace['__slots__'] = tuple(
+                '_' + key for key, value in namespace.items()
+                if issetting(value)
+            )
+        return super(ConfigableMeta, meta).__new__(
+            meta, name, bases, namespace
+        )
+
+
+class Configable(ConfigableBase, metaclass=ConfigableMeta):
     """
     A Configable is subclass aware (with a little help)! Given
 
@@ -36,124 +61,381 @@ class Configable(ConfigableBase):
         })
     """
 
-    def __new__(cls, config, *args, **kwargs):
+    __slots__ = ()
+
+    # Inherited by every subclass; lets collections test "is this a
+    # Configable type?" with one attribute read instead of issubclass's
+    # MRO walk.
+    __is_configable__ = True
+
+    # Set to False on a subclass (and its whole base chain) to store
+    # settings in __slots__ and drop the per-instance __dict__; see
+    # ConfigableMeta. Instances of such classes can't grow arbitrary
+    # attributes from callbacks.
+    EXTRA_ATTRS = True
+
+    # The settings defined on this class and its bases, collected once at
+    # class creation by __init_subclass__. Scanning with inspect.getmembers
+    # on every __init__ walks the whole MRO per instance; the result only
+    # depends on the class, so compute it there instead.
+    __configable_settings__ = ()
+
+    # Flat per-class table of (name, assign) pairs, where assign is the
+    # setting's fused assignment closure, so the __init__ loop is one
+    # call per setting with no descriptor dispatch. __setting_dict__
+    # maps each name to the same closure for lookups keyed by config.
+    __setting_table__ = ()
+    __setting_dict__ = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super(Configable, cls).__init_subclass__(**kwargs)
+        # Resolve each name to its most-derived definition first, so a
+        # subclass shadowing an inherited setting with a plain attribute
+        # really removes it from the table; then collect the settings in
+        # base-first definition order.
+        resolved = {}
+        for base in cls.__mro__:
+            for name, attr in vars(base).items():
+                if name not in resolved:
+                    resolved[name] = attr
+        settings = {}
+        for base in reversed(cls.__mro__):
+            for name in vars(base):
+                attr = resolved[name]
+                if name not in settings and issetting(attr):
+                    attr._bind(name)
+                    settings[name] = attr
+        cls.__configable_settings__ = tuple(settings.items())
+        cls.__setting_table__ = tuple(
+            (name, s._assign) for name, s in cls.__configable_settings__
+        )
+        cls.__setting_dict__ = dict(cls.__setting_table__)
+        # A new subclass makes any subtype dispatch cached on its bases
+        # stale; drop those caches so they are rebuilt on next use.
+        for base in cls.__mro__:
+            if '_subtype_dispatch' in base.__dict__:
+                del base._subtype_dispatch
+        _resolve_subtype.cache_clear()
+
+    @classmethod
+    def _build_subtype_dispatch(cls):
+        """
+        Split the direct subclasses into the dict-SUBTYPE and
+        callable-SUBTYPE kinds once, with the dict items pre-extracted,
+        so __new__ doesn't walk __subclasses__ per instantiation.
+        """
+        dicts = []
+        funcs = []
         for subcls in cls.__subclasses__():
             subtype = getattr(subcls, 'SUBTYPE', None)
             if isinstance(subtype, dict):
-                if not isinstance(config, dict):
-                    raise ValueError(
-                        'Instantiating %s: config must be a dict. Got type %s with value %s.' %
-                        (cls.__name__, type(config), str(config))
-                    )
-                match = True
-                for name, value in subtype.iteritems():
-                    config_value = config.get(name)
-                    if value != config_value:
-                        match = False
-                        break
-                if match:
-                    # The following should call this __new__ again with
-                    # cls == subcls.
-                    return subcls(config, *args, **kwargs)
-            elif inspect.isfunction(subtype):
-                if subtype(config):
-                    return subcls(config, *args, **kwargs)
-
-        return super(Configable, cls).__new__(
-            cls, config, *args, **kwargs
+                dicts.append((tuple(subtype.items()), subcls))
+            elif callable(subtype):
+                funcs.append((subtype, subcls))
+        # Union of all dict-SUBTYPE keys: a config that shares none of
+        # them can't match any subclass, so __new__ can skip the scan
+        # with one set intersection. A None subtype value would match a
+        # missing key, so don't short-circuit in that (odd) case.
+        keys = None
+        if all(v is not None for items, _ in dicts for _, v in items):
+            keys = frozenset(k for items, _ in dicts for k, _ in items)
+        # Index the signatures for O(1) matching: one table per distinct
+        # key set, mapping the value tuple to (definition order, class).
+        # Unhashable subtype values keep the linear scan instead.
+        tables = []
+        table_index = {}
+        for order, (items, subcls) in enumerate(dicts):
+            pairs = sorted(items)
+            ks = tuple(k for k, _ in pairs)
+            vals = tuple(v for _, v in pairs)
+            try:
+                hash(vals)
+            except TypeError:
+                tables = None
+                break
+            table = table_index.get(ks)
+            if table is None:
+                table = table_index[ks] = {}
+                tables.append((ks, table))
+            table.setdefault(vals, (order, subcls))
+        dispatch = (
+            tuple(dicts), tuple(funcs), keys,
+            tuple(sorted(keys)) if keys is not None else None,
+            tuple(tables) if tables is not None else None
         )
+        cls._subtype_dispatch = dispatch
+        return dispatch
+
+    def __new__(cls, config, *args, **kwargs):
+        dispatch = cls.__dict__.get('_subtype_dispatch')
+        if dispatch is None:
+            dispatch = cls._build_subtype_dispatch()
+        dicts, funcs, subtype_keys, sorted_keys, tables = dispatch
+
+        if dicts:
+            if not isinstance(config, dict):
+                raise ValueError(
+                    'Instantiating %s: config must be a dict. Got type %s with value %s.' %
+                    (cls.__name__, type(config), str(config))
+                )
+            subcls = None
+            if subtype_keys is None:
+                subcls = _scan_subtypes(dicts, config)
+            elif not subtype_keys.isdisjoint(config):
+                # Matching depends only on the config values at the
+                # subtype keys, so repeated shapes (homogeneous maps and
+                # arrays) resolve from the cache.
+                key = tuple((k, config.get(k)) for k in sorted_keys)
+                try:
+                    subcls = _resolve_subtype(cls, key)
+                except TypeError:
+                    # Unhashable config values can't be a cache key.
+                    subcls = _scan_subtypes(dicts, config)
+            if subcls is not None:
+                # The following should call this __new__ again with
+                # cls == subcls.
+                return subcls(config, *args, **kwargs)
+        for subtype, subcls in funcs:
+            if subtype(config):
+                return subcls(config, *args, **kwargs)
+
+        return super(Configable, cls).__new__(cls)
 
     def __init__(self, config):
         if isinstance(config, dict):
-            self._settings = inspect.getmembers(self.__class__, predicate=issetting)
-            for name, setting in self._settings:
-                setting.name = name
-                setattr(self, name, config.get(name))
-
-    def issetting(self, name):
-        return name in self._settings
+            cls = type(self)
+            table = cls.__setting_table__
+            if not table:
+                return
+            # One walk over the config instead of one hash probe per
+            # setting, then fill in whatever the config didn't mention.
+            # A fully specified config — the common case — never pays
+            # for the second pass, just a counter.
+            setting_dict = cls.__setting_dict__
+            assigned = 0
+            for key, value in config.items():
+                assign = setting_dict.get(key)
+                if assign is not None:
+                    assign(self, value)
+                    assigned += 1
+            if assigned != len(table):
+                for name, assign in table:
+                    if name not in config:
+                        assign(self, None)
+
+    @classmethod
+    def from_validated(cls, config):
+        """
+        Fast-path constructor for a config that has already passed
+        validation once (hot reloads, re-parsing the same source).
+        Values are stored as-is with no required/choices/kind checks
+        and no subtype dispatch — call it on the resolved class — but
+        init callbacks still run. Garbage in, garbage stored.
+        """
+        self = object.__new__(cls)
+        if isinstance(config, dict):
+            for name, s in cls.__configable_settings__:
+                value = config.get(name)
+                if value is None:
+                    value = s.default
+                setattr(self, s._private_name, value)
+                if s.init is not None:
+                    s.init(self, value)
+        return self
 
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a list of cls instances from an iterable of config dicts
+        — the bulk-ingestion path. Validation, casts and init callbacks
+        all run exactly as in the constructor, but when cls has no
+        SUBTYPE subclasses the per-record constructor dispatch is
+        skipped and the fused assign loop is run directly on a bare
+        instance.
+        """
+        dispatch = cls.__dict__.get('_subtype_dispatch')
+        if dispatch is None:
+            dispatch = cls._build_subtype_dispatch()
+        if dispatch[0] or dispatch[1]:
+            # Subtype dispatch might pick a subclass per record; take
+            # the ordinary constructor path.
+            return [cls(record) for record in records]
+        table = cls.__setting_table__
+        new = object.__new__
+        instances = []
+        append = instances.append
+        for record in records:
+            self = new(cls)
+            for name, assign in table:
+                assign(self, record.get(name))
+            append(self)
+        return instances
 
-class ConfigableCollection(ConfigableBase):
-    def _init_configables(self):
-        if not hasattr(self, 'TYPE'):
-            raise ValueError(
-                'You must define TYPE on your ConfigableCollection '
-                'subclass, %s.' % self.__class__.__name__
-            )
-        if not issubclass(self.TYPE, Configable):
-            raise TypeError(
-                '%s.TYPE must be a subclass of Configable' %
-                self.__class__.__name__
-            )
+    def issetting(self, name):
+        return any(name == sname for sname, _ in type(self).__configable_settings__)
 
-        for name, value in self.iterator():
-            # Prepare settings on each configable, but do not
-            # run handlers.
-            self[name] = self.TYPE(value)
 
-    def iterator(self):
-        raise NotImplementedError
+def _check_collection_type(collection):
+    if not hasattr(collection, 'TYPE'):
+        raise ValueError(
+            'You must define TYPE on your collection '
+            'subclass, %s.' % collection.__class__.__name__
+        )
+    if not getattr(collection.TYPE, '__is_configable__', False):
+        raise TypeError(
+            '%s.TYPE must be a subclass of Configable' %
+            collection.__class__.__name__
+        )
 
 
-class ConfigableMap(dict, ConfigableCollection):
+class ConfigableMap(dict, ConfigableBase):
     """
-    Map strings to Configable instances.
+    Map strings to Configable instances. Values are kept raw until the
+    first lookup wraps them in TYPE, so entries that are never read are
+    never built; iteration and values() expose whatever is currently
+    stored.
     """
 
     def __init__(self, config):
+        _check_collection_type(self)
         super(ConfigableMap, self).__init__(config)
-        self._init_configables()
 
-    def iterator(self):
-        return self.iteritems()
+    def __getitem__(self, name):
+        value = dict.__getitem__(self, name)
+        if not isinstance(value, self.TYPE):
+            value = self.TYPE(value)
+            dict.__setitem__(self, name, value)
+        return value
 
-class ConfigableArray(list, ConfigableCollection):
+    def get(self, name, default=None):
+        if name in self:
+            return self[name]
+        return default
+
+class ConfigableArray(list, ConfigableBase):
     """
-    Array of Configables of a given type.
+    Array of Configables of a given type. Like ConfigableMap, elements
+    are wrapped in TYPE on first access rather than up front; slices
+    and iteration expose whatever is currently stored.
     """
 
     def __init__(self, config, _is_root=True):
+        _check_collection_type(self)
         super(ConfigableArray, self).__init__(config)
-        self._init_configables()
 
-    def iterator(self):
-        return enumerate(self)
+    def __getitem__(self, index):
+        value = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return value
+        if not isinstance(value, self.TYPE):
+            value = self.TYPE(value)
+            list.__setitem__(self, index, value)
+        return value
 
 class setting(object):
     """
     A decorator that tags methods of a Config subclass that handle
     config values.
     """
-    def __init__(self, required=False, kind=None, default=None, choices=None):
+    __slots__ = (
+        'required', 'kind', 'default', 'choices', 'init', 'name',
+        'decorator', '_assign', '_private_name', '_choice_set', 'eager',
+        '_lazy'
+    )
+
+    def __init__(self, required=False, kind=None, default=None, choices=None,
+                 eager=False):
+        self.eager = eager
+        self._lazy = False
         self.required = required
         self.kind = kind
         self.default = default
         self.choices = choices
+        # Frozenset membership is O(1) where the raw list is O(n);
+        # unhashable choices keep the sequence.
+        if choices is None:
+            self._choice_set = None
+        else:
+            try:
+                self._choice_set = frozenset(choices)
+            except TypeError:
+                self._choice_set = choices
         self.init = None
         self.name = str(id(self))
         self.decorator = False
+        self._assign = None
+        self._private_name = '_' + self.name
+
+    def _bind(self, name):
+        """
+        Fix the setting's name and fuse the required/default/choices/
+        kind/init cascade into a single closure over locals. The shape
+        of the cascade is known here (class-creation time), so per-value
+        assignment doesn't re-read it off the descriptor. A bare
+        setting() gets a store-only fast path.
+        """
+        # Interned so dict lookups keyed on the name — the private
+        # storage attribute and __setting_dict__ — compare by pointer;
+        # '_' + name used to be rebuilt on every call.
+        name = self.name = sys.intern(name)
+        priv = self._private_name = sys.intern('_' + name)
+        required = self.required
+        default = self.default
+        choices = self.choices
+        choice_set = self._choice_set
+        kind = self.kind
+        init = self.init
+
+        # A Configable child with no init callback doesn't need to be
+        # built until somebody reads it: store the raw config and let
+        # __get__ materialize it on first access. A callback forces the
+        # eager path, since it observes the constructed child.
+        self._lazy = (
+            init is None and not self.eager and
+            getattr(kind, '__is_configable__', False)
+        )
+        if self._lazy:
+            kind = None
+
+        if not required and default is None and choices is None \
+                and kind is None and init is None:
+            def assign(obj, value):
+                setattr(obj, priv, value)
+        else:
+            def assign(obj, value):
+                if value is None:
+                    if required:
+                        raise ValueError(
+                            'Setting "%s" is required' % name
+                        )
+                    elif default is not None:
+                        value = default
+                if choices is not None:
+                    try:
+                        allowed = value in choice_set
+                    except TypeError:
+                        # Unhashable value; the raw sequence can still
+                        # answer by equality.
+                        allowed = value in choices
+                    if not allowed:
+                        raise ValueError(
+                            'Setting "%s" must be one of %s' %
+                            (name, choices)
+                        )
+                # Cast value to expected type; if it's already exactly
+                # that type the cast is a no-op, so skip the call.
+                if value is not None and kind is not None \
+                        and value.__class__ is not kind:
+                    value = kind(value)
+                setattr(obj, priv, value)
+                if init is not None:
+                    init(obj, value)
+        self._assign = assign
 
     def __set__(self, obj, value):
-        if value is None:
-            if self.required:
-                raise ValueError(
-                    'Setting "%s" is required' % self.name
-                )
-            elif self.default is not None:
-                value = self.default
-        if self.choices is not None:
-            if value not in self.choices:
-                raise ValueError(
-                    'Setting "%s" must be one of %s' %
-                    (self.name, self.choices)
-                )
-        # Cast value to expected type
-        if value is not None and self.kind is not None:
-            value = self.kind(value)
-        setattr(obj, '_' + self.name, value)
-        if self.init is not None:
-            self.init(obj, value)
+        if self._assign is None:
+            self._bind(self.name)
+        self._assign(obj, value)
 
     def __get__(self, obj, objtype=None):
         if obj is None:
@@ -161,13 +443,21 @@ class setting(object):
             # the class (not instance; accessing the setting on an instance
             # will get/set the value of the setting):
             return self
-        return getattr(obj, '_' + self.name, None)
+        value = getattr(obj, self._private_name, None)
+        if self._lazy and value is not None \
+                and not isinstance(value, self.kind):
+            # First access of a lazily stored child config; build it
+            # and cache the instance in its place.
+            value = self.kind(value)
+            setattr(obj, self._private_name, value)
+        return value
 
     def __call__(self, initOrObj, value=None):
         if self.decorator:
             self.init(initOrObj, value)
             return
-        self.name = initOrObj.__name__
+        self.name = sys.intern(initOrObj.__name__)
+        self._private_name = sys.intern('_' + self.name)
         self.init = initOrObj
         self.decorator = True
         return self
@@ -175,3 +465,42 @@ class setting(object):
 
 def issetting(thing):
     return isinstance(thing, setting)
+
+
+def _scan_subtypes(dicts, config):
+    """
+    Linear fallback over the cached dict-SUBTYPE entries for cls.
+    """
+    for items, subcls in dicts:
+        for name, value in items:
+            if config.get(name) != value:
+                break
+        else:
+            return subcls
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _resolve_subtype(cls, key):
+    """
+    Match the dict-SUBTYPE subclasses of cls against key, a sorted
+    tuple of (name, config value) pairs covering cls's subtype keys.
+    Cached because collections re-resolve the same shapes over and
+    over; cleared whenever a new Configable subclass is defined.
+    """
+    dispatch = cls.__dict__.get('_subtype_dispatch')
+    if dispatch is None:
+        dispatch = cls._build_subtype_dispatch()
+    values = dict(key)
+    tables = dispatch[4]
+    if tables is None:
+        return _scan_subtypes(dispatch[0], values)
+    # Probe one table per distinct signature key set; when several
+    # signatures match, the first-defined subclass wins, same as the
+    # old subclass-order scan.
+    best = None
+    for ks, table in tables:
+        hit = table.get(tuple(values.get(k) for k in ks))
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    return best[1] if best is not None else None
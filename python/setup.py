@@ -22,11 +22,45 @@ class Setup(Configable):
     def run(self):
         url = 'https://github.com/' + self.githubuser + '/' + self.name
         long_desc = 'See ' + url
+        # Converting the README is slow, so cache the pandoc output in
+        # README.rst and reuse it while it's newer than the markdown.
+        # A bare except here also swallowed real errors (and building
+        # the exception costs more than the checks below).
         try:
-            import pypandoc
-            long_desc = pypandoc.convert('README.md', 'rst')
-        except:
+            if (os.path.exists('README.rst') and
+                    os.path.getmtime('README.rst') >=
+                    os.path.getmtime('README.md')):
+                with open('README.rst') as f:
+                    long_desc = f.read()
+            else:
+                import pypandoc
+                long_desc = pypandoc.convert('README.md', 'rst')
+                with open('README.rst', 'w') as f:
+                    f.write(long_desc)
+        except ImportError:
             pass
+        except (IOError, OSError):
+            pass
+        # Set CONFIGABLE_CYTHON to compile the module with Cython; the
+        # descriptor protocol and __init__ loop are pure per-call
+        # interpreter overhead that compilation cuts down. Compilation
+        # is strictly best-effort — any failure (no Cython, compile
+        # error) falls back to the pure-python install that works
+        # everywhere.
+        ext_modules = []
+        if os.environ.get('CONFIGABLE_CYTHON'):
+            try:
+                from Cython.Build import cythonize
+                ext_modules = cythonize(
+                    ['configable/__init__.py'],
+                    language_level=3,
+                    compiler_directives={
+                        'boundscheck': False,
+                        'wraparound': False
+                    }
+                )
+            except Exception:
+                ext_modules = []
         setup(
             name=self.name,
             version=self.version,
@@ -38,7 +72,8 @@ class Setup(Configable):
             license=self.license,
             keywords=self.keywords,
             url=url,
-            long_description=long_desc
+            long_description=long_desc,
+            ext_modules=ext_modules
         )
 
 
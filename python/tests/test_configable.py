@@ -128,6 +128,53 @@ class Test(unittest.TestCase):
             'mom': {'name': 'Lois'}
         })
 
+    def test_lazy_nested_configable(runner):
+        builds = []
+
+        class Child(Configable):
+            name = setting(required=True)
+
+            def __init__(self, config):
+                builds.append(config)
+                super(Child, self).__init__(config)
+
+        class Parent(Configable):
+            kid = setting(kind=Child)
+
+        p = Parent({'kid': {'name': 'x'}})
+        # No callback on the setting, so the child isn't built until
+        # it's read; the first read caches the instance.
+        runner.assertEqual(builds, [])
+        kid = p.kid
+        runner.assertEqual(kid.name, 'x')
+        runner.assertEqual(len(builds), 1)
+        runner.assertIs(p.kid, kid)
+        runner.assertEqual(len(builds), 1)
+
+    def test_lazy_nested_error_deferred(runner):
+        class Child(Configable):
+            name = setting(required=True)
+
+        class Parent(Configable):
+            kid = setting(kind=Child)
+
+        # The bad child config isn't validated until first access.
+        p = Parent({'kid': {}})
+        with runner.assertRaises(ValueError) as cm:
+            p.kid
+
+    def test_eager_nested_configable(runner):
+        class Child(Configable):
+            name = setting(required=True)
+
+        class Parent(Configable):
+            kid = setting(kind=Child, eager=True)
+
+        with runner.assertRaises(ValueError) as cm:
+            p = Parent({'kid': {}})
+        p = Parent({'kid': {'name': 'x'}})
+        runner.assertIsInstance(p.kid, Child)
+
     #def test_location_aware(runner):
     #    class D(Configable):
     #        pass
@@ -159,6 +206,75 @@ class Test(unittest.TestCase):
     #    d1 = a.b.c['d1']
     #    runner.assertEqual(d1.config_path('.'), 'b.c.d1')
 
+    def test_configable_map_lazy(runner):
+        builds = []
+
+        class Dog(Configable):
+            size = setting(required=True)
+
+            def __init__(self, config):
+                builds.append(config)
+                super(Dog, self).__init__(config)
+
+        class DogMap(ConfigableMap):
+            TYPE = Dog
+
+        dogs = DogMap({
+            'gracie': {'size': 'medium'},
+            'bad': {}
+        })
+        # Nothing is wrapped until looked up; iteration and values()
+        # expose whatever is currently stored.
+        runner.assertEqual(builds, [])
+        runner.assertTrue(
+            all(isinstance(v, dict) for v in dogs.values())
+        )
+
+        gracie = dogs['gracie']
+        runner.assertIsInstance(gracie, Dog)
+        runner.assertEqual(len(builds), 1)
+        # Cached in place: same instance, no rebuild, visible to
+        # values() now.
+        runner.assertIs(dogs['gracie'], gracie)
+        runner.assertEqual(len(builds), 1)
+        runner.assertIn(gracie, dogs.values())
+
+        # get() wraps like __getitem__ does.
+        runner.assertIs(dogs.get('gracie'), gracie)
+        runner.assertIs(dogs.get('snoopy'), None)
+
+        # The invalid entry only fails when it's actually read.
+        with runner.assertRaises(ValueError) as cm:
+            dogs['bad']
+
+    def test_configable_array_lazy(runner):
+        builds = []
+
+        class Dog(Configable):
+            size = setting(required=True)
+
+            def __init__(self, config):
+                builds.append(config)
+                super(Dog, self).__init__(config)
+
+        class Dogs(ConfigableArray):
+            TYPE = Dog
+
+        dogs = Dogs([{'size': 'medium'}, {}])
+        runner.assertEqual(builds, [])
+        # Slices expose whatever is currently stored.
+        runner.assertTrue(all(isinstance(v, dict) for v in dogs[:]))
+
+        first = dogs[0]
+        runner.assertIsInstance(first, Dog)
+        runner.assertIs(dogs[0], first)
+        runner.assertEqual(len(builds), 1)
+        runner.assertIs(dogs[:][0], first)
+
+        # The invalid element only fails when it's actually read.
+        with runner.assertRaises(ValueError) as cm:
+            dogs[1]
+
     def test_configable_string(runner):
         class String(Configable):
             pass
@@ -254,6 +370,122 @@ class Test(unittest.TestCase):
         runner.assertEqual(sparky.size, 'large')
         runner.assertEqual(sparky.dog_size, 'large')
 
+    def test_from_records(runner):
+        class Dog(Configable):
+            @setting(required=True)
+            def name(self, value):
+                self.dog_name = value
+
+            size = setting(default='medium')
+
+        # No SUBTYPE subclasses: the fused fast path, with validation,
+        # defaults and callbacks intact.
+        dogs = Dog.from_records([
+            {'name': 'gracie'},
+            {'name': 'sparky', 'size': 'large'}
+        ])
+        runner.assertEqual(len(dogs), 2)
+        runner.assertIsInstance(dogs[0], Dog)
+        runner.assertEqual(dogs[0].dog_name, 'gracie')
+        runner.assertEqual(dogs[0].size, 'medium')
+        runner.assertEqual(dogs[1].size, 'large')
+        with runner.assertRaises(ValueError) as cm:
+            Dog.from_records([{}])
+
+    def test_from_records_subtype_dispatch(runner):
+        class Animal(Configable):
+            species = setting()
+
+        class Cat(Animal):
+            SUBTYPE = {'species': 'cat'}
+
+        # With subtypes around, from_records falls back to ordinary
+        # construction so dispatch still picks the subclass per record.
+        animals = Animal.from_records([
+            {'species': 'cat'},
+            {'species': 'dog'}
+        ])
+        runner.assertIsInstance(animals[0], Cat)
+        runner.assertNotIsInstance(animals[1], Cat)
+        runner.assertIsInstance(animals[1], Animal)
+
+    def test_from_validated(runner):
+        class C(Configable):
+            @setting(kind=int, default=5)
+            def a(self, value):
+                self.seen = value
+
+            b = setting(required=True, choices=['x'])
+
+        # Defaults fill and callbacks fire, but no cast, choices or
+        # required checks run: garbage in, garbage stored.
+        c = C.from_validated({'a': '7', 'b': 'zzz'})
+        runner.assertEqual(c.a, '7')
+        runner.assertEqual(c.seen, '7')
+        runner.assertEqual(c.b, 'zzz')
+
+        c = C.from_validated({'b': 'x'})
+        runner.assertEqual(c.a, 5)
+        runner.assertEqual(c.seen, 5)
+
+        c = C.from_validated({})
+        runner.assertIs(c.b, None)
+
+    def test_extra_attrs_false(runner):
+        class Lean(Configable):
+            EXTRA_ATTRS = False
+            a = setting(default=1)
+
+        lean = Lean({'a': 2})
+        runner.assertEqual(lean.a, 2)
+        runner.assertFalse(hasattr(lean, '__dict__'))
+        with runner.assertRaises(AttributeError) as cm:
+            lean.extra = 'nope'
+
+    def test_extra_attrs_inherited(runner):
+        class Lean(Configable):
+            EXTRA_ATTRS = False
+            a = setting(default=1)
+
+        # The flag inherits, and the subclass declares slots only for
+        # the settings in its own body; redeclaring a parent setting
+        # must not blow up.
+        class Leaner(Lean):
+            a = setting(default=5)
+            b = setting()
+
+        leaner = Leaner({'b': 2})
+        runner.assertEqual(leaner.a, 5)
+        runner.assertEqual(leaner.b, 2)
+        runner.assertFalse(hasattr(leaner, '__dict__'))
+        runner.assertEqual(Leaner.__slots__, ('_a', '_b'))
+
+    def test_shadow_setting_with_plain_attr(runner):
+        class A(Configable):
+            x = setting(required=True)
+
+        class B(A):
+            x = 'not a setting'
+
+        # x is no longer a setting on B, so the required check must not
+        # fire and __init__ must not clobber the plain attribute.
+        b = B({})
+        runner.assertEqual(b.x, 'not a setting')
+        runner.assertFalse(b.issetting('x'))
+        with runner.assertRaises(ValueError) as cm:
+            a = A({})
+
+    def test_shadow_setting_with_setting(runner):
+        class A(Configable):
+            x = setting(required=True)
+
+        class B(A):
+            x = setting(default='boosh')
+
+        b = B({})
+        runner.assertEqual(b.x, 'boosh')
+        runner.assertTrue(b.issetting('x'))
+
     def test_configable_array(runner):
         class Dog(Configable):
             @setting(required=True)